@@ -1,6 +1,10 @@
 import { NextRequest, NextResponse } from "next/server";
 import { getModelChain, type ModelTier } from "@/config/aiModels";
 import { callVeniceWithFallback } from "@/lib/venice/callVeniceWithFallback";
+import {
+  buildVeniceChatRequestBody,
+  validateVeniceChatRequestBody,
+} from "@/lib/venice/chatRequestBody";
 
 // Use Node.js runtime for longer timeout
 export const runtime = "nodejs";
@@ -78,43 +82,9 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
       );
     }
 
-    type VeniceChatRequestBody = {
-      messages: unknown[];
-      max_tokens: number;
-      temperature: number;
-      model: string;
-      stream: boolean;
-      response_format?: unknown;
-      venice_parameters?: Record<string, unknown>;
-      top_p?: number;
-      frequency_penalty?: number;
-      presence_penalty?: number;
-      seed?: number;
-    };
-
-    // Forward the request to Venice API
-    const requestBody: VeniceChatRequestBody = {
-      messages: body.messages || [],
-      // Use nullish coalescing so callers can intentionally pass 0 (e.g., temperature: 0)
-      max_tokens: (body.maxTokens ?? body.max_tokens ?? 16000) as number,
-      temperature: (body.temperature ?? 0.7) as number,
-      model: modelName,
-      stream: false,
-    };
-
-    // Venice-specific parameters (server-side defaults with pass-through override).
-    // Docs: https://docs.venice.ai/overview/about-venice
-    const incomingVeniceParams =
-      (body.venice_parameters as Record<string, unknown> | undefined) ??
-      (body.veniceParameters as Record<string, unknown> | undefined);
-    requestBody.venice_parameters =
-      incomingVeniceParams ??
-      ({
-        // Hide reasoning/thinking output when supported by the model.
-        strip_thinking_response: true,
-        // Avoid including Venice system prompts in responses when supported.
-        include_venice_system_prompt: false,
-      } satisfies Record<string, unknown>);
+    // Forward the request to Venice API (body shape shared with the
+    // server-side report-parser client — see src/lib/venice/chatRequestBody.ts)
+    const requestBody = buildVeniceChatRequestBody(body, modelName);
 
     // Dev-only: log the exact venice_parameters we are forwarding.
     if (process.env.NODE_ENV === "development") {
@@ -123,38 +93,11 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
       });
     }
 
-    // Optional JSON-mode / structured outputs (OpenAI-compatible)
-    // Pass through if provided by caller.
-    if (body.response_format) {
-      requestBody.response_format = body.response_format;
-    } else if (body.responseFormat) {
-      requestBody.response_format = body.responseFormat;
-    }
-
-    // Optional sampling params (pass-through)
-    if (typeof body.top_p === "number") requestBody.top_p = body.top_p;
-    if (typeof body.frequency_penalty === "number")
-      requestBody.frequency_penalty = body.frequency_penalty;
-    if (typeof body.presence_penalty === "number")
-      requestBody.presence_penalty = body.presence_penalty;
-    if (typeof body.seed === "number") requestBody.seed = body.seed;
-
     // Validate request body
-    if (
-      !requestBody.messages ||
-      !Array.isArray(requestBody.messages) ||
-      requestBody.messages.length === 0
-    ) {
-      return NextResponse.json(
-        { error: "Invalid request: messages array is required" },
-        { status: 400 },
-      );
-    }
-
-    // Validate max_tokens
-    if (!requestBody.max_tokens || requestBody.max_tokens < 1) {
+    const invalid = validateVeniceChatRequestBody(requestBody);
+    if (invalid) {
       return NextResponse.json(
-        { error: "Invalid request: max_tokens must be a positive number" },
+        { error: `Invalid request: ${invalid}` },
         { status: 400 },
       );
     }
@@ -90,17 +90,33 @@ const TIER_CHAINS: Record<ModelTier, Array<string | undefined>> = {
   parseVision: [env("VENICE_VISION_MODEL_NAME"), MODELS.vision],
 };
 
-/** The fallback chain for a tier, de-duplicated, primary first. */
-export function getModelChain(tier: ModelTier): string[] {
+function dedupeChain(models: Array<string | undefined>): readonly string[] {
   const seen = new Set<string>();
   const chain: string[] = [];
-  for (const m of TIER_CHAINS[tier]) {
+  for (const m of models) {
     if (m && !seen.has(m)) {
       seen.add(m);
       chain.push(m);
     }
   }
-  return chain;
+  return Object.freeze(chain);
+}
+
+/**
+ * Chains resolved once at module load — the env overrides above are read at
+ * load time too, so nothing here can change afterwards. Frozen because every
+ * caller shares the same array.
+ */
+const RESOLVED_CHAINS = Object.fromEntries(
+  (Object.keys(TIER_CHAINS) as ModelTier[]).map((t) => [
+    t,
+    dedupeChain(TIER_CHAINS[t]),
+  ]),
+) as Record<ModelTier, readonly string[]>;
+
+/** The fallback chain for a tier, de-duplicated, primary first. */
+export function getModelChain(tier: ModelTier): readonly string[] {
+  return RESOLVED_CHAINS[tier];
 }
 
 /** The primary (first-choice) model for a tier. */
@@ -111,8 +127,8 @@ export function getPrimaryModel(tier: ModelTier): string {
 /** Every model referenced by any tier — used to validate client-supplied ids. */
 export function knownModels(): Set<string> {
   const all = new Set<string>();
-  (Object.keys(TIER_CHAINS) as ModelTier[]).forEach((t) =>
-    getModelChain(t).forEach((m) => all.add(m)),
+  Object.values(RESOLVED_CHAINS).forEach((chain) =>
+    chain.forEach((m) => all.add(m)),
   );
   return all;
 }
@@ -0,0 +1,145 @@
+/**
+ * callVeniceWithFallback — per-model circuit breaker.
+ *
+ * Breaker state is module-level (per server instance), so each test loads a
+ * fresh copy of the module.
+ */
+
+type CallFn =
+  typeof import("@/lib/venice/callVeniceWithFallback").callVeniceWithFallback;
+type FallbackResult = Awaited<ReturnType<CallFn>>;
+
+const CHAIN = ["model-a", "model-b"];
+
+function jsonResponse(status: number): Response {
+  return new Response(
+    JSON.stringify(status === 200 ? { choices: [{ message: {} }] } : {}),
+    { status },
+  );
+}
+
+/** fetch mock answering per model from a status table. */
+function mockFetch(statusFor: (model: string) => number): jest.Mock {
+  const fn = jest.fn(async (_url: string, init?: RequestInit) => {
+    const { model } = JSON.parse(String(init?.body)) as { model: string };
+    return jsonResponse(statusFor(model));
+  });
+  global.fetch = fn as unknown as typeof fetch;
+  return fn;
+}
+
+function modelsCalled(fn: jest.Mock): string[] {
+  return fn.mock.calls.map(
+    ([, init]) => (JSON.parse(String(init.body)) as { model: string }).model,
+  );
+}
+
+describe("callVeniceWithFallback circuit breaker", () => {
+  const originalFetch = global.fetch;
+  let callVeniceWithFallback: CallFn;
+  const call = (): Promise<FallbackResult> =>
+    callVeniceWithFallback({
+      apiKey: "test",
+      endpoint: "https://venice.test/api/v1",
+      baseBody: { messages: [] },
+      chain: CHAIN,
+      label: "test",
+    });
+
+  beforeEach(() => {
+    jest.resetModules();
+    const mod = require("@/lib/venice/callVeniceWithFallback") as {
+      callVeniceWithFallback: CallFn;
+    };
+    callVeniceWithFallback = mod.callVeniceWithFallback;
+    jest.spyOn(console, "log").mockImplementation(() => {});
+    jest.spyOn(console, "warn").mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    global.fetch = originalFetch;
+    jest.restoreAllMocks();
+  });
+
+  it("skips a model that returned 404 on later requests", async () => {
+    const fetchMock = mockFetch((m) => (m === "model-a" ? 404 : 200));
+
+    const first = await call();
+    expect(first.modelUsed).toBe("model-b");
+    expect(modelsCalled(fetchMock)).toEqual(["model-a", "model-b"]);
+
+    fetchMock.mockClear();
+    const second = await call();
+    expect(second.modelUsed).toBe("model-b");
+    expect(second.fellBack).toBe(true);
+    expect(modelsCalled(fetchMock)).toEqual(["model-b"]);
+  });
+
+  it("records skipped models in attempts and the telemetry line", async () => {
+    mockFetch((m) => (m === "model-a" ? 404 : 200));
+    await call();
+
+    const log = console.log as jest.Mock;
+    log.mockClear();
+    const result = await call();
+
+    expect(result.attempts).toEqual([
+      { model: "model-a", status: 0, ok: false, skipped: true },
+      { model: "model-b", status: 200, ok: true },
+    ]);
+    expect(log).toHaveBeenCalledWith(
+      expect.stringContaining("fallback=true attempt=2/2 skipped=model-a"),
+    );
+  });
+
+  it("opens after 3 consecutive 429s and probes again after the window", async () => {
+    const fetchMock = mockFetch((m) => (m === "model-a" ? 429 : 200));
+    const now = Date.now();
+    jest.spyOn(Date, "now").mockReturnValue(now);
+
+    for (let i = 0; i < 3; i++) await call();
+    fetchMock.mockClear();
+
+    await call();
+    expect(modelsCalled(fetchMock)).toEqual(["model-b"]);
+
+    (Date.now as jest.Mock).mockReturnValue(now + 61_000);
+    fetchMock.mockClear();
+    await call();
+    expect(modelsCalled(fetchMock)).toEqual(["model-a", "model-b"]);
+  });
+
+  it("lets a single probe through when the window elapses", async () => {
+    const fetchMock = mockFetch((m) => (m === "model-a" ? 429 : 200));
+    const now = Date.now();
+    jest.spyOn(Date, "now").mockReturnValue(now);
+
+    for (let i = 0; i < 3; i++) await call();
+    (Date.now as jest.Mock).mockReturnValue(now + 61_000);
+    fetchMock.mockClear();
+
+    await Promise.all([call(), call(), call()]);
+    const probes = modelsCalled(fetchMock).filter((m) => m === "model-a");
+    expect(probes).toEqual(["model-a"]);
+  });
+
+  it("does not count 400s against the model", async () => {
+    const fetchMock = mockFetch((m) => (m === "model-a" ? 400 : 200));
+
+    for (let i = 0; i < 4; i++) await call();
+    fetchMock.mockClear();
+
+    await call();
+    expect(modelsCalled(fetchMock)).toEqual(["model-a", "model-b"]);
+  });
+
+  it("tries the full chain when every circuit is open", async () => {
+    const fetchMock = mockFetch(() => 404);
+
+    await expect(call()).rejects.toThrow(/all 2 models failed/);
+    fetchMock.mockClear();
+
+    await expect(call()).rejects.toThrow(/last status 404/);
+    expect(modelsCalled(fetchMock)).toEqual(["model-a", "model-b"]);
+  });
+});
@@ -25,8 +25,16 @@ export interface VeniceFallbackResult {
   teeProvider: string | null;
   /** True if a model other than the chain's primary served the response. */
   fellBack: boolean;
-  /** Per-model attempts, in order, for logging/telemetry. */
-  attempts: Array<{ model: string; status: number; ok: boolean }>;
+  /**
+   * Per-model attempts, in order, for logging/telemetry. `skipped` marks a
+   * model not called because its circuit breaker was open (status 0).
+   */
+  attempts: Array<{
+    model: string;
+    status: number;
+    ok: boolean;
+    skipped?: boolean;
+  }>;
 }
 
 /** Retry on these HTTP statuses (overload / capacity / transient upstream). */
@@ -47,13 +55,72 @@ function isRetriableParamError(status: number): boolean {
   return status === 400 || status === 404;
 }
 
+/**
+ * Per-model circuit breaker, kept per server instance. While a model's circuit
+ * is open it is skipped instead of costing every request a failed round-trip:
+ *  - 404 opens it for 10 min — the id is gone upstream and won't come back
+ *    between requests.
+ *  - 3 consecutive overload/transport failures (429, 5xx, network) open it for
+ *    60s — e.g. a saturated enclave pool.
+ * Once the window elapses the circuit is half-open: exactly one request is let
+ * through as a probe while the window is re-armed for everyone else. Success
+ * closes the circuit; another failure keeps it open. 400 is NOT counted — it
+ * depends on the request body, not the model.
+ */
+const DEAD_MODEL_OPEN_MS = 10 * 60 * 1000;
+const BREAKER_THRESHOLD = 3;
+const BREAKER_OPEN_MS = 60 * 1000;
+
+interface ModelCircuit {
+  failures: number;
+  openUntil: number; // epoch ms; 0 = closed
+  openMs: number; // window length, re-armed when a probe is handed out
+}
+const circuits = new Map<string, ModelCircuit>();
+
+function isCircuitOpen(model: string, now: number): boolean {
+  const c = circuits.get(model);
+  return c !== undefined && c.openUntil > now;
+}
+
+/** May this request call `model`? Hands out the single half-open probe. */
+function tryAcquire(model: string, now: number): boolean {
+  const c = circuits.get(model);
+  if (!c || c.openUntil === 0) return true;
+  if (c.openUntil > now) return false;
+  c.openUntil = now + c.openMs;
+  return true;
+}
+
+/** `status` 0 = network error / timeout. */
+function recordFailure(model: string, status: number): void {
+  const c = circuits.get(model) ?? { failures: 0, openUntil: 0, openMs: 0 };
+  if (status === 404) {
+    c.openMs = DEAD_MODEL_OPEN_MS;
+    c.openUntil = Date.now() + c.openMs;
+  } else if (status === 0 || isRetriable(status)) {
+    c.failures += 1;
+    if (c.failures >= BREAKER_THRESHOLD) {
+      c.openMs = BREAKER_OPEN_MS;
+      c.openUntil = Date.now() + c.openMs;
+    }
+  } else {
+    return;
+  }
+  circuits.set(model, c);
+}
+
+function recordSuccess(model: string): void {
+  circuits.delete(model);
+}
+
 export interface CallVeniceArgs {
   apiKey: string;
   endpoint: string; // e.g. "https://api.venice.ai/api/v1"
   /** Request body WITHOUT `model` — the caller-built payload. */
   baseBody: Record<string, unknown>;
   /** Ordered model fallback chain (primary first). */
-  chain: string[];
+  chain: readonly string[];
   /** Label for telemetry logs (e.g. tier name). */
   label: string;
   /** Optional per-request timeout in ms. */
@@ -68,8 +135,20 @@ export async function callVeniceWithFallback(
   let lastErrorText = "";
   let lastStatus = 0;
 
+  // Models whose circuit is open are skipped (and recorded as such) — unless
+  // every circuit in the chain is open, in which case the whole chain is tried.
+  const bypassBreaker = chain.every((m) => isCircuitOpen(m, Date.now()));
+  const skipped: string[] = [];
+  const isSkippable = (m: string): boolean =>
+    !bypassBreaker && isCircuitOpen(m, Date.now());
+
   for (let i = 0; i < chain.length; i++) {
     const model = chain[i];
+    if (!bypassBreaker && !tryAcquire(model, Date.now())) {
+      attempts.push({ model, status: 0, ok: false, skipped: true });
+      skipped.push(model);
+      continue;
+    }
     const body = { ...baseBody, model };
 
     const fetchOptions: RequestInit = {
@@ -89,6 +168,7 @@ export async function callVeniceWithFallback(
     } catch (err) {
       // Network/timeout — treat as retriable, try next model.
       attempts.push({ model, status: 0, ok: false });
+      recordFailure(model, 0);
       lastStatus = 0;
       lastErrorText = err instanceof Error ? err.message : String(err);
       continue;
@@ -97,6 +177,7 @@ export async function callVeniceWithFallback(
     attempts.push({ model, status: res.status, ok: res.ok });
 
     if (res.ok) {
+      recordSuccess(model);
       const data = await res.json();
       const teeHeader = res.headers.get("x-venice-tee");
       const teeServed = teeHeader === "true" || isEnclaveModel(model);
@@ -106,7 +187,9 @@ export async function callVeniceWithFallback(
       console.log(
         `[venice:${label}] served by ${model} tee=${teeServed}${
           teeProvider ? `/${teeProvider}` : ""
-        } fallback=${fellBack} attempt=${i + 1}/${chain.length}`,
+        } fallback=${fellBack} attempt=${i + 1}/${chain.length}${
+          skipped.length ? ` skipped=${skipped.join(",")}` : ""
+        }`,
       );
       return {
         data,
@@ -120,21 +203,23 @@ export async function callVeniceWithFallback(
 
     lastStatus = res.status;
     lastErrorText = await res.text().catch(() => "");
+    recordFailure(model, res.status);
 
+    const next = chain.slice(i + 1).find((m) => !isSkippable(m));
     const canRetry =
-      i < chain.length - 1 &&
+      next !== undefined &&
       (isRetriable(res.status) || isRetriableParamError(res.status));
     if (!canRetry) break;
 
     console.warn(
-      `[venice:${label}] ${model} returned ${res.status}; falling back to ${
-        chain[i + 1]
-      }`,
+      `[venice:${label}] ${model} returned ${res.status}; falling back to ${next}`,
     );
   }
 
   const err = new Error(
-    `[venice:${label}] all ${chain.length} models failed; last status ${lastStatus}: ${lastErrorText.slice(0, 300)}`,
+    `[venice:${label}] all ${chain.length} models failed${
+      skipped.length ? ` (skipped ${skipped.join(",")})` : ""
+    }; last status ${lastStatus}: ${lastErrorText.slice(0, 300)}`,
   );
   (err as Error & { status?: number }).status = lastStatus || 502;
   throw err;
@@ -0,0 +1,87 @@
+/**
+ * Venice chat-completions request body: builds the Venice payload from a
+ * caller's loose body (camelCase or snake_case keys) and validates it.
+ *
+ * Used by the `/api/venice` route and the server-side report-parser client
+ * (src/utils/reportParsers/veniceClient.ts).
+ */
+
+export interface VeniceChatRequestBody {
+  messages: unknown[];
+  max_tokens: number;
+  temperature: number;
+  model: string;
+  stream: boolean;
+  response_format?: unknown;
+  venice_parameters?: Record<string, unknown>;
+  top_p?: number;
+  frequency_penalty?: number;
+  presence_penalty?: number;
+  seed?: number;
+}
+
+export function buildVeniceChatRequestBody(
+  body: Record<string, unknown>,
+  model: string,
+): VeniceChatRequestBody {
+  const requestBody: VeniceChatRequestBody = {
+    messages: (body.messages as unknown[] | undefined) || [],
+    // Use nullish coalescing so callers can intentionally pass 0 (e.g., temperature: 0)
+    max_tokens: (body.maxTokens ?? body.max_tokens ?? 16000) as number,
+    temperature: (body.temperature ?? 0.7) as number,
+    model,
+    stream: false,
+  };
+
+  // Venice-specific parameters (server-side defaults with pass-through override).
+  // Docs: https://docs.venice.ai/overview/about-venice
+  const incomingVeniceParams =
+    (body.venice_parameters as Record<string, unknown> | undefined) ??
+    (body.veniceParameters as Record<string, unknown> | undefined);
+  requestBody.venice_parameters =
+    incomingVeniceParams ??
+    ({
+      // Hide reasoning/thinking output when supported by the model.
+      strip_thinking_response: true,
+      // Avoid including Venice system prompts in responses when supported.
+      include_venice_system_prompt: false,
+    } satisfies Record<string, unknown>);
+
+  // Optional JSON-mode / structured outputs (OpenAI-compatible)
+  if (body.response_format) {
+    requestBody.response_format = body.response_format;
+  } else if (body.responseFormat) {
+    requestBody.response_format = body.responseFormat;
+  }
+
+  // Optional sampling params (pass-through)
+  if (typeof body.top_p === "number") requestBody.top_p = body.top_p;
+  if (typeof body.frequency_penalty === "number")
+    requestBody.frequency_penalty = body.frequency_penalty;
+  if (typeof body.presence_penalty === "number")
+    requestBody.presence_penalty = body.presence_penalty;
+  if (typeof body.seed === "number") requestBody.seed = body.seed;
+
+  return requestBody;
+}
+
+/**
+ * Checks Venice would reject anyway, so callers fail before a round-trip.
+ * Returns the problem, or null if the body is sendable.
+ */
+export function validateVeniceChatRequestBody(
+  requestBody: VeniceChatRequestBody,
+): string | null {
+  if (
+    !requestBody.messages ||
+    !Array.isArray(requestBody.messages) ||
+    requestBody.messages.length === 0
+  ) {
+    return "messages array is required";
+  }
+  // Number() so a non-numeric value (e.g. "abc" from a loose body) is rejected.
+  if (!(Number(requestBody.max_tokens) >= 1)) {
+    return "max_tokens must be a positive number";
+  }
+  return null;
+}
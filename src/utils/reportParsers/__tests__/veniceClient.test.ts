@@ -0,0 +1,42 @@
+import { parseRetryAfterMs } from "@/utils/reportParsers/veniceClient";
+
+describe("parseRetryAfterMs", () => {
+  const NOW = Date.parse("2026-01-01T00:00:00Z");
+
+  beforeEach(() => {
+    jest.spyOn(Date, "now").mockReturnValue(NOW);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  test("returns null when the header is absent or blank", () => {
+    expect(parseRetryAfterMs(null)).toBeNull();
+    expect(parseRetryAfterMs("")).toBeNull();
+    expect(parseRetryAfterMs("   ")).toBeNull();
+  });
+
+  test("returns null for unparseable values", () => {
+    expect(parseRetryAfterMs("soon")).toBeNull();
+  });
+
+  test("converts delta-seconds to milliseconds", () => {
+    expect(parseRetryAfterMs("5")).toBe(5_000);
+    expect(parseRetryAfterMs(" 2 ")).toBe(2_000);
+  });
+
+  test("parses an HTTP-date relative to now", () => {
+    expect(parseRetryAfterMs("Thu, 01 Jan 2026 00:00:10 GMT")).toBe(10_000);
+  });
+
+  test("clamps past dates and negative values to 0", () => {
+    expect(parseRetryAfterMs("Wed, 31 Dec 2025 23:59:00 GMT")).toBe(0);
+    expect(parseRetryAfterMs("-5")).toBe(0);
+  });
+
+  test("caps long waits at 60s", () => {
+    expect(parseRetryAfterMs("3600")).toBe(60_000);
+    expect(parseRetryAfterMs("Fri, 02 Jan 2026 00:00:00 GMT")).toBe(60_000);
+  });
+});
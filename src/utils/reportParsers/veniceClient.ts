@@ -6,9 +6,31 @@
  */
 
 import { getPrimaryModel } from "@/config/aiModels";
+import {
+  buildVeniceChatRequestBody,
+  validateVeniceChatRequestBody,
+} from "@/lib/venice/chatRequestBody";
 
 const VENICE_API_URL = "https://api.venice.ai/api/v1/chat/completions";
 
+/** Upper bound on a server-requested wait, so a bad header can't stall a parse. */
+const MAX_RETRY_AFTER_MS = 60_000;
+
+/**
+ * Parse a `Retry-After` header (delta-seconds or HTTP-date) into milliseconds.
+ * Returns null when absent or unparseable so the caller uses its own backoff.
+ */
+export function parseRetryAfterMs(header: string | null): number | null {
+  const value = header?.trim();
+  if (!value) return null;
+  const seconds = Number(value);
+  const ms = Number.isFinite(seconds)
+    ? seconds * 1000
+    : Date.parse(value) - Date.now();
+  if (!Number.isFinite(ms)) return null;
+  return Math.min(Math.max(ms, 0), MAX_RETRY_AFTER_MS);
+}
+
 function getModelName(): string {
   // parseText tier (non-enclave: report parsing uses JSON mode / response_format,
   // which Venice TEE models reject). See src/config/aiModels.ts.
@@ -22,43 +44,23 @@ export async function callVenice(
     typeof process !== "undefined" ? process.env.VENICE_API_KEY : undefined;
 
   if (apiKey) {
-    // Server-side: call Venice API directly (mirrors route.ts logic)
+    // Server-side: call Venice API directly (same body as route.ts)
     const modelName = (body.model as string | undefined) ?? getModelName();
 
-    const requestBody: Record<string, unknown> = {
-      messages: body.messages || [],
-      max_tokens: (body.maxTokens ?? body.max_tokens ?? 16000) as number,
-      temperature: (body.temperature ?? 0.7) as number,
-      model: modelName,
-      stream: false,
-    };
-
-    // Venice-specific parameters
-    const incomingVeniceParams =
-      (body.venice_parameters as Record<string, unknown> | undefined) ??
-      (body.veniceParameters as Record<string, unknown> | undefined);
-    requestBody.venice_parameters = incomingVeniceParams ?? {
-      strip_thinking_response: true,
-      include_venice_system_prompt: false,
-    };
-
-    // Optional JSON-mode / structured outputs
-    if (body.response_format) {
-      requestBody.response_format = body.response_format;
-    } else if (body.responseFormat) {
-      requestBody.response_format = body.responseFormat;
-    }
+    const requestBody = buildVeniceChatRequestBody(body, modelName);
 
-    // Optional sampling params
-    if (typeof body.top_p === "number") requestBody.top_p = body.top_p;
-    if (typeof body.frequency_penalty === "number")
-      requestBody.frequency_penalty = body.frequency_penalty;
-    if (typeof body.presence_penalty === "number")
-      requestBody.presence_penalty = body.presence_penalty;
-    if (typeof body.seed === "number") requestBody.seed = body.seed;
+    // Fail fast on bodies Venice would reject (same checks as /api/venice)
+    // rather than spending a round-trip — and the retry budget — on them.
+    const invalid = validateVeniceChatRequestBody(requestBody);
+    if (invalid) throw new Error(`Venice API: ${invalid}`);
 
-    // Retry on 429 with exponential backoff (5s, 15s). Each attempt gets its
-    // own 120s timeout so retries aren't charged against the first call's clock.
+    // Serialized once; every retry sends the identical payload.
+    const payload = JSON.stringify(requestBody);
+
+    // Retry on 429, honoring Venice's Retry-After when sent and otherwise
+    // backing off 2.5-5s, then 7.5-15s (jittered so parses throttled together
+    // don't retry in lockstep). Each attempt gets its own 120s timeout so retries
+    // aren't charged against the first call's clock.
     const MAX_RETRIES = 2;
     const RETRY_DELAYS_MS = [5_000, 15_000];
     let lastError: Error = new Error("Venice API: no attempts made");
@@ -71,7 +73,7 @@ export async function callVenice(
           "Content-Type": "application/json",
           Accept: "application/json",
         },
-        body: JSON.stringify(requestBody),
+        body: payload,
         signal: AbortSignal.timeout(120_000),
       });
 
@@ -83,7 +85,11 @@ export async function callVenice(
       );
 
       if (response.status === 429 && attempt < MAX_RETRIES) {
-        const delay = RETRY_DELAYS_MS[attempt] ?? 15_000;
+        const base = RETRY_DELAYS_MS[attempt] ?? 15_000;
+        const delay = Math.round(
+          parseRetryAfterMs(response.headers.get("retry-after")) ??
+            base / 2 + Math.random() * (base / 2),
+        );
         console.warn(
           `[veniceClient] 429 on attempt ${attempt + 1}/${MAX_RETRIES + 1} — retrying in ${delay / 1000}s`,
         );